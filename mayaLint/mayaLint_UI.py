@@ -470,20 +470,22 @@ class UI(QtWidgets.QMainWindow):
     def oneOfs(self, command):
         nodes = self.contexts[self.currentContextUUID]['nodes']
         diagnostics = self.contexts[self.currentContextUUID]['diagnostics']
-        newDiagnostics = self.commandToRun([command], nodes)
+        with mcc.runCache():
+            nodes, SLMesh = mcc.meshSelection(nodes)
+            if not nodes:
+                cmds.warning("No nodes to check")
+                return
+            newDiagnostics = self.commandToRun([command], nodes, SLMesh)
         diagnostics[command] = newDiagnostics[command]
         self.createReport(self.currentContextUUID)
 
-    def commandToRun(self, commands, nodes):
+    def commandToRun(self, commands, nodes, SLMesh):
+        # Called inside mcc.runCache(), with the nodes and mesh selection
+        # from mcc.meshSelection
         diagnostics = {}
-        SLMesh = om.MSelectionList()
-        nodes = [node for node in nodes if cmds.ls(node, uuid=True)] 
-        longNodeNames = [cmds.ls(node, uuid=True)[0] for node in nodes]
-        for node in longNodeNames:
-            nodeName = cmds.ls(node)
-            shapes = cmds.listRelatives(nodeName, shapes=True, typ="mesh")
-            if shapes:
-                SLMesh.add(node)
+        # Checks run one after another on the main thread: maya.cmds and
+        # the OpenMaya iterators they use are not thread-safe, so they
+        # cannot be dispatched to a thread pool.
         for command in commands:
             type, errors = getattr(
                 mcc, command)(nodes, SLMesh)
@@ -505,17 +507,19 @@ class UI(QtWidgets.QMainWindow):
         
         outputErrors = []
         typeMapping = {
-            "uv": ".map[{}]",
-            "vertex": ".vtx[{}]",
-            "edge": ".e[{}]",
-            "polygon": ".f[{}]",
+            "uv": ".map[",
+            "vertex": ".vtx[",
+            "edge": ".e[",
+            "polygon": ".f[",
          }
         
         for uuid in uuids:
             nodeName = cmds.ls(uuid)
             if nodeName:
-                for component in uuids[uuid]:
-                    outputErrors.append(nodeName[0] + typeMapping[type].format(component))
+                # Build the "mesh.f[" prefix once per mesh, failing meshes can
+                # hold hundreds of thousands of components
+                prefix = nodeName[0] + typeMapping[type]
+                outputErrors.extend([prefix + str(component) + "]" for component in uuids[uuid]])
         return outputErrors
 
 
@@ -652,16 +656,17 @@ class UI(QtWidgets.QMainWindow):
                     nodes = self.contexts[contextUUID]['nodes']
             else:
                 nodes = self.contexts[contextUUID]['nodes']
-            
-            nodes = [uuid for uuid in nodes if cmds.ls(uuid, uuid=True)]
 
-            if not nodes:
-                cmds.warning("No nodes to check")
-                return
-            
-            row = self.contexts[contextUUID]['tableItem'].row()
-            self.contextTable.item(row, 3).setText("Running...")
-            diagnostics = self.commandToRun(checkedCommands, nodes)
+            with mcc.runCache():
+                nodes, SLMesh = mcc.meshSelection(nodes)
+
+                if not nodes:
+                    cmds.warning("No nodes to check")
+                    return
+
+                row = self.contexts[contextUUID]['tableItem'].row()
+                self.contextTable.item(row, 3).setText("Running...")
+                diagnostics = self.commandToRun(checkedCommands, nodes, SLMesh)
             self.contexts[contextUUID]['nodes'] = nodes
             self.contexts[contextUUID]['diagnostics'] = diagnostics
             self.currentContextUUID = contextUUID
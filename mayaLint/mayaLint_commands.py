@@ -1,49 +1,577 @@
-from collections import defaultdict
+import math
+import os
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import product
 
 import maya.cmds as cmds
 import maya.api.OpenMaya as om
 
+# NumPy ships with recent Maya versions. When it is missing the checks fall
+# back to walking the mesh with the OpenMaya iterators.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Returns Error Tuple
 #     "uv": {}, [UUID] : [... uvId]
 #     "vertex": {},[UUID] : [... vertexId ]
 #     "edge" : {},[UUID] : [... edgeId ]
 #     "polygon": {}, -> [UUID] : [... polygonId ]
 #     "nodes" : [] -> [... nodes UUIDs]
+# Ids are always plain lists. The NumPy checks keep them as arrays and convert
+# with a single tolist() per mesh, see _addFlagged.
+
+# Results shared between checks during a single run. Only populated inside
+# runCache(), so a check called on its own always sees the current scene.
+_runCache = None
+
+
+@contextmanager
+def runCache():
+    """Share expensive scene queries between the checks of a single run."""
+    global _runCache
+    _runCache = {}
+    try:
+        yield
+    finally:
+        _runCache = None
+
+
+def meshSelection(nodes):
+    """Return the nodes that still exist and a selection list of those with mesh shapes.
+
+    The nodes and their shapes are resolved with batched queries, which the
+    checks then reuse when called inside the same runCache().
+    """
+    SLMesh = om.MSelectionList()
+    nodeNames = _getNodeNames(nodes)
+    nodes = [node for node in nodes if nodeNames[node]]
+    shapesByNode = _getShapes(nodes)
+    meshShapes = _meshShapes(shapesByNode)
+    for node in nodes:
+        if any(shape in meshShapes for shape in shapesByNode[node]):
+            SLMesh.add(nodeNames[node])
+    return nodes, SLMesh
+
 
 # Internal Utility Functions
-def _getNodeName(uuid):
-    nodeName = cmds.ls(uuid, uuid=True)
-    if nodeName:
-        return nodeName[0]
-    return None
+def _cached(key, func, *args):
+    if _runCache is None:
+        return func(*args)
+    if key not in _runCache:
+        _runCache[key] = func(*args)
+    return _runCache[key]
+
+
+def _resolveNames(uuids, cacheKey, long=False):
+    names = _cached(cacheKey, dict)
+    missing = [uuid for uuid in uuids if uuid not in names]
+    if missing:
+        # Nodes that no longer exist are left out of the ls results
+        names.update(dict.fromkeys(missing))
+        existing = cmds.ls(missing, uuid=True) or []
+        if not long:
+            names.update((uuid, uuid) for uuid in existing)
+        elif existing:
+            # ls doesn't promise to keep the order of its arguments, so the
+            # nodes go into one selection list and every item is read back
+            # with its own UUID and path
+            selection = om.MSelectionList()
+            for uuid in existing:
+                selection.add(uuid)
+            for index in range(selection.length()):
+                node = selection.getDependNode(index)
+                fn = om.MFnDependencyNode(node)
+                if node.hasFn(om.MFn.kDagNode):
+                    name = selection.getDagPath(index).fullPathName()
+                else:
+                    name = fn.name()
+                names[fn.uuid().asString()] = name
+    return {uuid: names[uuid] for uuid in uuids}
+
+
+def _getNodeNames(uuids):
+    """Resolve many UUIDs with a single cmds.ls call, keyed by UUID.
+
+    Inside runCache() the names are kept for the whole run, so later checks
+    only query UUIDs that have not been resolved yet.
+    """
+    return _resolveNames(uuids, 'nodeNames')
+
+
+def _getLongNames(uuids):
+    """Resolve many UUIDs to full DAG paths, see _getNodeNames."""
+    return _resolveNames(uuids, 'longNames', long=True)
+
+
+def _getShapes(uuids):
+    """Return the full paths of the shapes below every node, keyed by UUID.
+
+    All nodes are queried with a single listRelatives call and the shapes are
+    matched back to their node by parent path, only instanced nodes are
+    queried on their own. Like the names, the shapes are kept for the whole
+    run inside runCache().
+    """
+    shapes = _cached('shapes', dict)
+    missing = [uuid for uuid in uuids if uuid not in shapes]
+    if missing:
+        longNames = _getLongNames(missing)
+        parents = [name for name in longNames.values() if name]
+        shapesByParent = defaultdict(list)
+        if parents:
+            for shape in cmds.listRelatives(parents, shapes=True, fullPath=True) or []:
+                shapesByParent[shape.rpartition('|')[0]].append(shape)
+        for uuid in missing:
+            shapes[uuid] = shapesByParent.get(longNames[uuid], [])
+        # An instanced node can be listed under another of its paths, so
+        # those are queried one at a time by UUID
+        for uuid in _instancedNodes(longNames):
+            shapes[uuid] = cmds.listRelatives(uuid, shapes=True, fullPath=True) or []
+    return {uuid: shapes[uuid] for uuid in uuids}
+
+
+def _instancedNodes(longNames):
+    """Return the UUIDs in longNames whose node is instanced, directly or
+    through one of its parents."""
+    resolved = [(uuid, name) for uuid, name in longNames.items() if name]
+    selection = om.MSelectionList()
+    for uuid, name in resolved:
+        selection.add(name)
+    if selection.length() != len(resolved):
+        # Items were merged, so they can't be matched back by index
+        return {uuid for uuid, name in resolved}
+    return {uuid for index, (uuid, name) in enumerate(resolved)
+            if selection.getDagPath(index).isInstanced()}
+
+
+def _meshShapes(shapesByNode, **flags):
+    """Return the mesh shapes among the values of shapesByNode as a set of
+    full paths, filtered with a single ls call."""
+    allShapes = [shape for shapes in shapesByNode.values() for shape in shapes]
+    if not allShapes:
+        return set()
+    return set(cmds.ls(allShapes, type='mesh', long=True, **flags) or [])
+
+
+def _nodeTypes(paths):
+    """Return the node type of every full DAG path with a single ls call."""
+    if not paths:
+        return {}
+    listing = cmds.ls(paths, long=True, showType=True) or []
+    return dict(zip(listing[::2], listing[1::2]))
+
+
+def _facePass(SLMesh):
+    """Walk every face once, collecting the results of the face checks when
+    NumPy is missing. With NumPy each check reads the cached mesh arrays."""
+    return _cached(('facePass', id(SLMesh)), _collectFaceResults, SLMesh)
+
+
+# Mesh iterators visit components in index order, so the loops below step
+# them by component count and skip the isDone() and index() calls per step.
+def _collectFaceResults(SLMesh):
+    results = {
+        'triangles': defaultdict(list),
+        'ngons': defaultdict(list),
+        'lamina': defaultdict(list),
+        'zeroAreaFaces': defaultdict(list),
+        'noneStarlike': defaultdict(list),
+    }
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        faceIt = om.MItMeshPolygon(dagPath)
+        for index in range(mesh.numPolygons):
+            numOfEdges = len(faceIt.getEdges())
+            if numOfEdges == 3:
+                results['triangles'][uuid].append(index)
+            elif numOfEdges > 4:
+                results['ngons'][uuid].append(index)
+            if faceIt.isLamina() is True:
+                results['lamina'][uuid].append(index)
+            if faceIt.isStarlike() is False:
+                results['noneStarlike'][uuid].append(index)
+            if faceIt.getArea() <= 0.00000001:
+                results['zeroAreaFaces'][uuid].append(index)
+            faceIt.next()
+    return results
+
+
+def _edgePass(SLMesh):
+    """Walk every edge once, collecting the results of the edge checks.
+
+    With NumPy zeroLengthEdges measures the edges from the mesh arrays
+    instead, so only runs that ask for it pay for them.
+    """
+    return _cached(('edgePass', id(SLMesh)), _collectEdgeResults, SLMesh)
+
+
+def _collectEdgeResults(SLMesh):
+    results = {
+        'hardEdges': defaultdict(list),
+        'openEdges': defaultdict(list),
+        'noneManifoldEdges': defaultdict(list),
+        'zeroLengthEdges': defaultdict(list),
+    }
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        edgeIt = om.MItMeshEdge(dagPath)
+        for index in range(mesh.numEdges):
+            numConnectedFaces = edgeIt.numConnectedFaces()
+            if numConnectedFaces < 2:
+                results['openEdges'][uuid].append(index)
+            elif numConnectedFaces > 2:
+                results['noneManifoldEdges'][uuid].append(index)
+            if edgeIt.isSmooth is False and edgeIt.onBoundary() is False:
+                results['hardEdges'][uuid].append(index)
+            if np is None and edgeIt.length() <= 0.00000001:
+                results['zeroLengthEdges'][uuid].append(index)
+            edgeIt.next()
+    return results
+
+
+def _toArray(mayaArray, dtype):
+    return np.fromiter(mayaArray, dtype=dtype, count=len(mayaArray))
+
+
+def _pointsArray(mesh, space=om.MSpace.kObject):
+    """Return the vertex positions of mesh as an (n, 3) array, shared across a run."""
+    return _cached(('points', id(mesh), space), _collectPoints, mesh, space)
+
+
+def _collectPoints(mesh, space):
+    # Convert the whole MPointArray in one call rather than reading the
+    # x, y and z attributes of every MPoint
+    return np.array(mesh.getPoints(space), dtype=np.float64).reshape(-1, 4)[:, :3]
+
+
+def _uvArrays(mesh):
+    """Return the U and V coordinates of mesh as arrays, shared across a run."""
+    return _cached(('uvs', id(mesh)), _collectUVs, mesh)
+
+
+def _collectUVs(mesh):
+    Us, Vs = mesh.getUVs()
+    return _toArray(Us, np.float64), _toArray(Vs, np.float64)
+
+
+def _assignedUVs(mesh):
+    """Return the UV count of every face and the flat list of its UV ids,
+    shared across a run."""
+    return _cached(('assignedUVs', id(mesh)), _collectAssignedUVs, mesh)
+
+
+def _collectAssignedUVs(mesh):
+    uvCounts, uvIds = mesh.getAssignedUVs()
+    return _toArray(uvCounts, np.int64), _toArray(uvIds, np.int64)
+
+
+def _sumPerFace(faceIds, values, numFaces):
+    """Sum the rows of an (n, 3) array into one row per face."""
+    return np.stack([np.bincount(faceIds, weights=values[:, axis], minlength=numFaces)
+                     for axis in range(3)], axis=1)
+
+
+def _triangleNormals(mesh):
+    """Return the face of every triangle in Maya's triangulation and its
+    object space normal, scaled to twice the triangle area. Shared across a
+    run by the face areas and flippedNormals."""
+    return _cached(('triangleNormals', id(mesh)), _collectTriangleNormals, mesh)
+
+
+def _collectTriangleNormals(mesh):
+    points = _pointsArray(mesh)
+    triangleCounts, triangleVertices = mesh.getTriangles()
+    corners = points[_toArray(triangleVertices, np.int64).reshape(-1, 3)]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    faceIds = np.repeat(np.arange(mesh.numPolygons), _toArray(triangleCounts, np.int64))
+    return faceIds, normals
+
+
+def _faceNormals(mesh):
+    """Return the object space normal of every face, scaled to twice its
+    area, shared across a run by flippedNormals and concaveFaces."""
+    return _cached(('faceNormals', id(mesh)), _collectFaceNormals, mesh)
+
+
+def _collectFaceNormals(mesh):
+    faceIds, normals = _triangleNormals(mesh)
+    return _sumPerFace(faceIds, normals, mesh.numPolygons)
+
+
+def _faceAreas(mesh):
+    """Return the area of every face, summed over Maya's triangulation."""
+    return _cached(('faceAreas', id(mesh)), _collectFaceAreas, mesh)
+
+
+def _collectFaceAreas(mesh):
+    faceIds, normals = _triangleNormals(mesh)
+    triangleAreas = 0.5 * np.sqrt(np.einsum('ij,ij->i', normals, normals))
+    return np.bincount(faceIds, weights=triangleAreas, minlength=mesh.numPolygons)
+
+
+def _uvAreas(SLMesh):
+    """Return the 3D area, UV area and UV mask of the faces of every mesh
+    with UVs, keyed by UUID, shared by uvDistortion and texelDensity."""
+    return _cached(('uvAreas', id(SLMesh)), _collectUVAreas, SLMesh)
+
+
+def _collectUVAreas(SLMesh):
+    contexts = [context for context in _meshContexts(SLMesh) if context.mesh.numUVs()]
+    uvAreas = _mapArrays(_shoelaceAreas, [
+        _assignedUVs(mesh) + _uvArrays(mesh) for dagPath, uuid, mesh in contexts])
+    return {uuid: (_faceAreas(mesh),) + areas
+            for (dagPath, uuid, mesh), areas in zip(contexts, uvAreas)}
+
+
+def _shoelaceAreas(arrays):
+    """Return the UV area of every face and a mask of the faces that have UVs,
+    from the face UV counts, the flat UV ids and the U and V coordinates."""
+    counts, ids, us, vs = arrays
+    u = us[ids]
+    v = vs[ids]
+    # Shoelace formula, pairing each corner with the next one of its face
+    hasUVs = counts > 0
+    ends = np.cumsum(counts)[hasUVs]
+    nextCorner = np.arange(1, len(ids) + 1)
+    nextCorner[ends - 1] = ends - counts[hasUVs]
+    faceIds = np.repeat(np.arange(len(counts)), counts)
+    cross = u * v[nextCorner] - u[nextCorner] * v
+    return np.abs(np.bincount(faceIds, weights=cross, minlength=len(counts))) / 2.0, hasUVs
+
+
+def _cellKeys(cells):
+    return (cells[:, 0] * 73856093) ^ (cells[:, 1] * 19349663) ^ (cells[:, 2] * 83492791)
+
+
+def _overlappingPoints(points, tolerance):
+    """Return a mask of the points closer than tolerance to another point.
+
+    Points are bucketed into a grid of cells twice the tolerance wide, so
+    each point only needs comparing against the points of the eight cells
+    nearest to it. Cells are matched by a hashed key; a collision only adds
+    candidates that the distance test then rejects.
+    """
+    scaled = points / (tolerance * 2)
+    cells = np.floor(scaled).astype(np.int64)
+    sides = np.where(scaled - cells < 0.5, -1, 1)
+    keys = _cellKeys(cells)
+    order = np.argsort(keys, kind='stable')
+    cellKeys, cellStarts, cellCounts = np.unique(
+        keys[order], return_index=True, return_counts=True)
+    overlapping = np.zeros(len(points), dtype=bool)
+    for offset in product((0, 1), repeat=3):
+        neighbourKeys = _cellKeys(cells + sides * offset)
+        cellIds = np.minimum(np.searchsorted(cellKeys, neighbourKeys), len(cellKeys) - 1)
+        counts = np.where(cellKeys[cellIds] == neighbourKeys, cellCounts[cellIds], 0)
+        pointIds = np.repeat(np.arange(len(points)), counts)
+        starts = np.repeat(cellStarts[cellIds] - (np.cumsum(counts) - counts), counts)
+        candidateIds = order[np.arange(len(pointIds)) + starts]
+        offsets = points[pointIds] - points[candidateIds]
+        close = np.einsum('ij,ij->i', offsets, offsets) < tolerance ** 2
+        overlapping[pointIds[close & (pointIds != candidateIds)]] = True
+    return overlapping
+
+
+def _threadCount():
+    try:
+        return max(1, int(os.environ.get('MAYALINT_THREADS', 1)))
+    except ValueError:
+        return 1
+
+
+def _mapArrays(func, arrays):
+    """Apply func to every array (or tuple of arrays), over MAYALINT_THREADS
+    worker threads if set.
+
+    Only pure NumPy work may be passed in, such as _laminaFaces,
+    _shoelaceAreas, _overlappingPoints and _concavePolygons. maya.cmds and
+    OpenMaya are not thread-safe, so callers fetch every array from the scene
+    on the main thread first and only hand the arrays over.
+    """
+    threads = _threadCount()
+    if threads < 2 or len(arrays) < 2:
+        return [func(array) for array in arrays]
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(func, arrays))
+
+
+def _addFlagged(results, uuid, mask):
+    """Record the indices where mask is set, leaving clean meshes out."""
+    indices = np.flatnonzero(mask)
+    if len(indices):
+        results[uuid].extend(indices.tolist())
+
+
+def _faceVertices(mesh):
+    """Return the vertex count of every face, the flat face-vertex list and
+    the position of the next corner around each face, shared across a run."""
+    return _cached(('faceVertices', id(mesh)), _collectFaceVertices, mesh)
+
+
+def _collectFaceVertices(mesh):
+    counts, vertices = mesh.getVertices()
+    counts = _toArray(counts, np.int64)
+    vertices = _toArray(vertices, np.int64)
+    ends = np.cumsum(counts)
+    # Index of the next vertex around each face, wrapping back to the start
+    following = np.arange(1, len(vertices) + 1)
+    following[ends[counts > 0] - 1] = (ends - counts)[counts > 0]
+    return counts, vertices, following
+
+
+def _faceEdgeKeys(mesh):
+    """Return a key for the edge leaving every face corner, equal for both
+    directions of an edge."""
+    counts, vertices, following = _faceVertices(mesh)
+    first = np.minimum(vertices, vertices[following])
+    second = np.maximum(vertices, vertices[following])
+    return first * mesh.numVertices + second
+
+
+def _uniqueEdges(mesh):
+    """Return the two vertex ids of every edge, derived from the face lists."""
+    keys = np.unique(_faceEdgeKeys(mesh))
+    return keys // mesh.numVertices, keys % mesh.numVertices
+
+
+def _shortEdges(dagPath, mesh, tolerance):
+    """Return the ids of the edges no longer than tolerance.
+
+    Lengths are measured in bulk between the vertex pairs of the face lists,
+    only the few short pairs are then matched to their Maya edge ids.
+    """
+    points = _pointsArray(mesh)
+    first, second = _uniqueEdges(mesh)
+    offsets = points[first] - points[second]
+    short = np.einsum('ij,ij->i', offsets, offsets) <= tolerance ** 2
+    edges = []
+    if short.any():
+        vertexIt = om.MItMeshVertex(dagPath)
+        for start, end in zip(first[short].tolist(), second[short].tolist()):
+            vertexIt.setIndex(start)
+            for edge in vertexIt.getConnectedEdges():
+                if end in mesh.getEdgeVertices(edge):
+                    edges.append(edge)
+    return sorted(edges)
+
+
+def _laminaFaces(faceEdges):
+    """Return a mask of the faces that share all of their edges with another face.
+
+    faceEdges holds the vertex count of every face and the _faceEdgeKeys of
+    the mesh.
+    """
+    counts, edgeKeys = faceEdges
+    starts = np.cumsum(counts) - counts
+    lamina = np.zeros(len(counts), dtype=bool)
+    # Only faces of the same size can share all edges, so each size is
+    # compared as one block of sorted edge keys
+    for size in np.unique(counts).tolist():
+        faces = np.flatnonzero(counts == size)
+        rows = np.sort(edgeKeys[starts[faces, None] + np.arange(size)], axis=1)
+        inverse, occurrences = np.unique(
+            rows, axis=0, return_inverse=True, return_counts=True)[1:]
+        lamina[faces] = occurrences[inverse.ravel()] > 1
+    return lamina
+
+
+def _concavePolygons(faceGeometry):
+    """Return a mask of the faces with a corner that turns against the face normal.
+
+    faceGeometry holds the _faceVertices of the mesh, its points and its face
+    normals.
+    """
+    counts, vertices, following, points, faceNormals = faceGeometry
+    positions = points[vertices]
+    edgeOut = positions[following] - positions
+    previous = np.empty_like(following)
+    previous[following] = np.arange(len(following))
+    edgeIn = edgeOut[previous]
+    cornerFaceIds = np.repeat(np.arange(len(counts)), counts)
+    normals = faceNormals[cornerFaceIds]
+    # Sine of the turn at every corner, measured around the face normal so
+    # non-planar faces are judged on their projection
+    turns = np.einsum('ij,ij->i', np.cross(edgeIn, edgeOut), normals)
+    lengths = (np.sqrt(np.einsum('ij,ij->i', edgeIn, edgeIn)) *
+               np.sqrt(np.einsum('ij,ij->i', edgeOut, edgeOut)) *
+               np.sqrt(np.einsum('ij,ij->i', normals, normals)))
+    sines = np.divide(turns, lengths, out=np.zeros_like(turns), where=lengths > 0)
+    # Collinear corners give a sine of zero, the tolerance keeps float noise
+    # on them from flagging the face
+    reflex = np.bincount(cornerFaceIds, weights=sines < -0.00001, minlength=len(counts))
+    return (counts > 3) & (reflex > 0)
+
+
+MeshContext = namedtuple('MeshContext', ['dagPath', 'uuid', 'mesh'])
+
+
+def _meshContexts(SLMesh):
+    """Return a MeshContext for every mesh in SLMesh, shared across a run."""
+    return _cached(('meshContexts', id(SLMesh)), _collectMeshContexts, SLMesh)
+
+
+def _collectMeshContexts(SLMesh):
+    contexts = []
+    selIt = om.MItSelectionList(SLMesh)
+    while not selIt.isDone():
+        dagPath = selIt.getDagPath()
+        mesh = om.MFnMesh(dagPath)
+        # Empty shapes have no components to flag, so no check needs to
+        # build an iterator or fetch arrays for them
+        if mesh.numPolygons:
+            fn = om.MFnDependencyNode(dagPath.node())
+            contexts.append(MeshContext(dagPath, fn.uuid().asString(), mesh))
+        selIt.next()
+    return contexts
+
+
+def _shadingGroups(SLMesh):
+    """Return the first shading group name of every mesh, shared across a run."""
+    return _cached(('shadingGroups', id(SLMesh)), _collectShadingGroups, SLMesh)
+
+
+def _collectShadingGroups(SLMesh):
+    # Walk the selection list rather than _meshContexts, a mesh with no faces
+    # can still have a shading group assigned
+    shadingGroups = {}
+    selIt = om.MItSelectionList(SLMesh)
+    while not selIt.isDone():
+        dagPath = selIt.getDagPath()
+        mesh = om.MFnMesh(dagPath)
+        shaders = mesh.getConnectedShaders(mesh.dagPath().instanceNumber())[0]
+        if len(shaders):
+            uuid = om.MFnDependencyNode(dagPath.node()).uuid().asString()
+            shadingGroups[uuid] = om.MFnDependencyNode(shaders[0]).name()
+        selIt.next()
+    return shadingGroups
 
 
 # Functions to be imported
 def trailingNumbers(nodes, _):
     trailingNumbers = []
+    nodeNames = _getNodeNames(nodes)
     for node in nodes:
-        nodeName = _getNodeName(node)
+        nodeName = nodeNames[node]
         if nodeName and nodeName[-1].isdigit():
                 trailingNumbers.append(node)
     return "nodes", trailingNumbers
 
 def duplicatedNames(nodes, _):
-    nodesByShortName = defaultdict(list)
-    for node in nodes:
-        nodeName = _getNodeName(node)
-        name = nodeName.rsplit('|', 1)[-1]
-        nodesByShortName[name].append(node)
-    invalid = []
-    for name, shortNameNodes in nodesByShortName.items():
-        if len(shortNameNodes) > 1:
-            invalid.extend(shortNameNodes)
+    nodeNames = _getNodeNames(nodes)
+    shortNames = [(node, nodeNames[node].rpartition('|')[2])
+                  for node in nodes if nodeNames[node]]
+    nameCounts = Counter(name for _, name in shortNames)
+    invalid = [node for node, name in shortNames if nameCounts[name] > 1]
     return "nodes", invalid
 
 
 def namespaces(nodes, _):
     namespaces = []
+    nodeNames = _getNodeNames(nodes)
     for node in nodes:
-        nodeName = _getNodeName(node)
+        nodeName = nodeNames[node]
         if nodeName and ':' in nodeName:
             namespaces.append(node)
     return "nodes", namespaces
@@ -51,298 +579,278 @@ def namespaces(nodes, _):
 
 def shapeNames(nodes, _):
     shapeNames = []
+    longNames = _getLongNames(nodes)
+    shapes = _getShapes(nodes)
     for node in nodes:
-        nodeName = _getNodeName(node)
-        if nodeName:
-            new = nodeName.split('|')
-            shape = cmds.listRelatives(nodeName, shapes=True)
-            if shape:
-                shapename = new[-1] + "Shape"
-                if shape[0] != shapename:
-                    shapeNames.append(node)
+        shape = shapes[node]
+        if shape:
+            shapename = longNames[node].rpartition('|')[2] + "Shape"
+            if shape[0].rpartition('|')[2] != shapename:
+                shapeNames.append(node)
     return "nodes", shapeNames
 
 def triangles(_, SLMesh):
+    if np is None:
+        return "polygon", _facePass(SLMesh)['triangles']
     triangles = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        faceIt = om.MItMeshPolygon(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not faceIt.isDone():
-            numOfEdges = faceIt.getEdges()
-            if len(numOfEdges) == 3:
-                triangles[uuid].append(faceIt.index())
-            faceIt.next()
-        selIt.next()
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        _addFlagged(triangles, uuid, _faceVertices(mesh)[0] == 3)
     return "polygon", triangles
 
 
 def ngons(_, SLMesh):
+    if np is None:
+        return "polygon", _facePass(SLMesh)['ngons']
     ngons = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        faceIt = om.MItMeshPolygon(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not faceIt.isDone():
-            numOfEdges = faceIt.getEdges()
-            if len(numOfEdges) > 4:
-                ngons[uuid].append(faceIt.index())
-            faceIt.next()
-        selIt.next()
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        _addFlagged(ngons, uuid, _faceVertices(mesh)[0] > 4)
     return "polygon", ngons
 
 def hardEdges(_, SLMesh):
-    hardEdges = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        edgeIt = om.MItMeshEdge(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not edgeIt.isDone():
-            if edgeIt.isSmooth is False and edgeIt.onBoundary() is False:
-                hardEdges[uuid].append(edgeIt.index())
-            edgeIt.next()
-        selIt.next()
-    return "edge", hardEdges
+    return "edge", _edgePass(SLMesh)['hardEdges']
 
 def lamina(_, SLMesh):
+    if np is None:
+        return "polygon", _facePass(SLMesh)['lamina']
     lamina = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        faceIt = om.MItMeshPolygon(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not faceIt.isDone():
-            laminaFaces = faceIt.isLamina()
-            if laminaFaces is True:
-                lamina[uuid].append(faceIt.index())
-            faceIt.next()
-        selIt.next()
+    contexts = _meshContexts(SLMesh)
+    masks = _mapArrays(_laminaFaces, [
+        (_faceVertices(mesh)[0], _faceEdgeKeys(mesh)) for dagPath, uuid, mesh in contexts])
+    for (dagPath, uuid, mesh), mask in zip(contexts, masks):
+        _addFlagged(lamina, uuid, mask)
     return "polygon", lamina
 
 
 def zeroAreaFaces(_, SLMesh):
+    if np is None:
+        return "polygon", _facePass(SLMesh)['zeroAreaFaces']
     zeroAreaFaces = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        faceIt = om.MItMeshPolygon(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not faceIt.isDone():
-            faceArea = faceIt.getArea()
-            if faceArea <= 0.00000001:
-                zeroAreaFaces[uuid].append(faceIt.index())
-            faceIt.next()
-        selIt.next()
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        _addFlagged(zeroAreaFaces, uuid, _faceAreas(mesh) <= 0.00000001)
     return "polygon", zeroAreaFaces
 
 
 def zeroLengthEdges(_, SLMesh):
-    zeroLengthEdges = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        edgeIt = om.MItMeshEdge(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not edgeIt.isDone():
-            if edgeIt.length() <= 0.00000001:
-                zeroLengthEdges[uuid].append(edgeIt.index())
-            edgeIt.next()
-        selIt.next()
+    if np is None:
+        return "edge", _edgePass(SLMesh)['zeroLengthEdges']
+    zeroLengthEdges = {}
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        edges = _shortEdges(dagPath, mesh, 0.00000001)
+        if edges:
+            zeroLengthEdges[uuid] = edges
     return "edge", zeroLengthEdges
 
 def selfPenetratingUVs(transformNodes, _):
     selfPenetratingUVs = defaultdict(list)
+    shapesByNode = _getShapes(transformNodes)
+    # Filter every shape down to non-intermediate meshes at once instead of
+    # a listRelatives call per node
+    meshShapes = _meshShapes(shapesByNode, noIntermediate=True)
     for node in transformNodes:
-        nodeName = _getNodeName(node)
-        shapes = cmds.listRelatives(
-            nodeName,
-            shapes=True,
-            type="mesh",
-            noIntermediate=True)
+        shapes = [shape for shape in shapesByNode[node] if shape in meshShapes]
         if shapes:
             overlapping = cmds.polyUVOverlap("{}.f[*]".format(shapes[0]), oc=True)
             if overlapping:
-                formatted = [ overlap.split("{}.f[".format(shapes[0]))[1][:-1] for overlap in overlapping ]
+                # Keep the text between the brackets, compacted ranges like
+                # "f[2:5]" are passed on as they are
+                formatted = [overlap[overlap.rindex('[') + 1:-1] for overlap in overlapping]
                 selfPenetratingUVs[node].extend(formatted)
     return "polygon", selfPenetratingUVs
 
 def noneManifoldEdges(_, SLMesh):
-    noneManifoldEdges = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        edgeIt = om.MItMeshEdge(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not edgeIt.isDone():
-            if edgeIt.numConnectedFaces() > 2:
-                noneManifoldEdges[uuid].append(edgeIt.index())
-            edgeIt.next()
-        selIt.next()
-    return "edge", noneManifoldEdges
+    return "edge", _edgePass(SLMesh)['noneManifoldEdges']
 
 
 def openEdges(_, SLMesh):
-    openEdges = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        edgeIt = om.MItMeshEdge(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not edgeIt.isDone():
-            if edgeIt.numConnectedFaces() < 2:
-                openEdges[uuid].append(edgeIt.index())
-            edgeIt.next()
-        selIt.next()
-    return "edge", openEdges
+    return "edge", _edgePass(SLMesh)['openEdges']
 
 
 def poles(_, SLMesh):
     poles = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        vertexIt = om.MItMeshVertex(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not vertexIt.isDone():
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        if np is not None:
+            first, second = _uniqueEdges(mesh)
+            numConnectedEdges = np.bincount(
+                np.concatenate((first, second)), minlength=mesh.numVertices)
+            _addFlagged(poles, uuid, numConnectedEdges > 5)
+            continue
+        vertexIt = om.MItMeshVertex(dagPath)
+        for index in range(mesh.numVertices):
             if vertexIt.numConnectedEdges() > 5:
-                poles[uuid].append(vertexIt.index())
+                poles[uuid].append(index)
             vertexIt.next()
-        selIt.next()
     return "vertex", poles
 
 
 def starlike(_, SLMesh):
+    if np is None:
+        return "polygon", _facePass(SLMesh)['noneStarlike']
+    # The other face checks don't need a face walk with NumPy, so starlike
+    # walks the faces on its own
     noneStarlike = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        polyIt = om.MItMeshPolygon(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not polyIt.isDone():
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        polyIt = om.MItMeshPolygon(dagPath)
+        for index in range(mesh.numPolygons):
             if polyIt.isStarlike() is False:
-                noneStarlike[uuid].append(polyIt.index())
+                noneStarlike[uuid].append(index)
             polyIt.next()
-        selIt.next()
     return "polygon", noneStarlike
 
 def missingUVs(_, SLMesh):
     missingUVs = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        faceIt = om.MItMeshPolygon(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not faceIt.isDone():
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        # Without any UVs in the current set every face is missing them
+        if mesh.numUVs() == 0:
+            missingUVs[uuid] = list(range(mesh.numPolygons))
+            continue
+        if np is not None:
+            _addFlagged(missingUVs, uuid, _assignedUVs(mesh)[0] == 0)
+            continue
+        faceIt = om.MItMeshPolygon(dagPath)
+        for index in range(mesh.numPolygons):
             if faceIt.hasUVs() is False:
-                missingUVs[uuid].append(faceIt.index())
+                missingUVs[uuid].append(index)
             faceIt.next()
-        selIt.next()
     return "polygon", missingUVs
 
 def uvRange(_, SLMesh):
     uvRange = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        mesh = om.MFnMesh(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        if np is not None:
+            U, V = _uvArrays(mesh)
+            _addFlagged(uvRange, uuid, (U < 0) | (U > 10) | (V < 0))
+            continue
         Us, Vs = mesh.getUVs()
         for i in range(len(Us)):
             if Us[i] < 0 or Us[i] > 10 or Vs[i] < 0:
                 uvRange[uuid].append(i)
-        selIt.next()
     return "uv", uvRange
 
 def onBorder(_, SLMesh):
     onBorder = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        mesh = om.MFnMesh(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        # Measure the distance to the nearest integer, truncating with int()
+        # missed UVs just below a border and mishandled negative tiles
+        if np is not None:
+            U, V = _uvArrays(mesh)
+            _addFlagged(onBorder, uuid,
+                        (np.abs(U - np.rint(U)) < 0.00001) | (np.abs(V - np.rint(V)) < 0.00001))
+            continue
         Us, Vs = mesh.getUVs()
         for i in range(len(Us)):
-            if abs(int(Us[i]) - Us[i]) < 0.00001 or abs(int(Vs[i]) - Vs[i]) < 0.00001:
+            if abs(round(Us[i]) - Us[i]) < 0.00001 or abs(round(Vs[i]) - Vs[i]) < 0.00001:
                 onBorder[uuid].append(i)
-        selIt.next()
     return "uv", onBorder
 
 def crossBorder(_, SLMesh):
     crossBorder = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        faceIt = om.MItMeshPolygon(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-        while not faceIt.isDone():
-            U, V = set(), set()
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        if np is not None:
+            counts, ids = _assignedUVs(mesh)
+            hasUVs = counts > 0
+            for index in np.flatnonzero(~hasUVs).tolist():
+                cmds.warning("Face " + str(index) + " has no UVs")
+            if not len(ids):
+                continue
+            Us, Vs = _uvArrays(mesh)
+            U = Us[ids]
+            V = Vs[ids]
+            # A face crosses a border when its lowest and highest UVs fall
+            # in different tiles, floor is monotonic so only those two matter
+            starts = (np.cumsum(counts) - counts)[hasUVs]
+            crosses = np.zeros(len(counts), dtype=bool)
+            crosses[hasUVs] = (
+                (np.floor(np.maximum.reduceat(U, starts)) != np.floor(np.minimum.reduceat(U, starts))) |
+                (np.floor(np.maximum.reduceat(V, starts)) != np.floor(np.minimum.reduceat(V, starts))))
+            _addFlagged(crossBorder, uuid, crosses)
+            continue
+        faceIt = om.MItMeshPolygon(dagPath)
+        for index in range(mesh.numPolygons):
             try:
                 UVs = faceIt.getUVs()
                 Us, Vs, = UVs[0], UVs[1]
-                for i in range(len(Us)):
-                    uAdd = int(Us[i]) if Us[i] > 0 else int(Us[i]) - 1
-                    vAdd = int(Vs[i]) if Vs[i] > 0 else int(Vs[i]) - 1
-                    U.add(uAdd)
-                    V.add(vAdd)
-                if len(U) > 1 or len(V) > 1:
-                    crossBorder[uuid].append(faceIt.index())
-                faceIt.next()
+                if len(Us) and (math.floor(min(Us)) != math.floor(max(Us)) or
+                                math.floor(min(Vs)) != math.floor(max(Vs))):
+                    crossBorder[uuid].append(index)
             except:
-                cmds.warning("Face " + str(faceIt.index()) + " has no UVs")
-                faceIt.next()
-        selIt.next()
+                cmds.warning("Face " + str(index) + " has no UVs")
+            faceIt.next()
     return "polygon", crossBorder
 
+# Decomposing the world matrix leaves float noise in otherwise frozen
+# values, so compare within a tolerance rather than exactly
+UNFROZEN_TRANSFORM_TOLERANCE = 0.00001
+
 def unfrozenTransforms(nodes, _):
     unfrozenTransforms = []
+    longNames = _getLongNames(nodes)
+    # Resolve every node into one selection list, full paths are unique so
+    # each index matches one node
+    selection = om.MSelectionList()
+    resolved = []
     for node in nodes:
-        nodeName = _getNodeName(node)
-        translation = cmds.xform(
-            nodeName, q=True, worldSpace=True, translation=True)
-        rotation = cmds.xform(nodeName, q=True, worldSpace=True, rotation=True)
-        scale = cmds.xform(nodeName, q=True, worldSpace=True, scale=True)
-        if translation != [0.0, 0.0, 0.0] or rotation != [0.0, 0.0, 0.0] or scale != [1.0, 1.0, 1.0]:
+        if longNames[node]:
+            selection.add(longNames[node])
+            resolved.append(node)
+    for index, node in enumerate(resolved):
+        # Decompose the world matrix instead of three cmds.xform queries
+        matrix = om.MTransformationMatrix(selection.getDagPath(index).inclusiveMatrix())
+        rotation = matrix.rotation()
+        values = zip(
+            list(matrix.translation(om.MSpace.kWorld)) + [rotation.x, rotation.y, rotation.z] +
+            list(matrix.scale(om.MSpace.kWorld)),
+            [0.0] * 6 + [1.0] * 3)
+        if any(abs(value - frozen) > UNFROZEN_TRANSFORM_TOLERANCE for value, frozen in values):
             unfrozenTransforms.append(node)
     return "nodes", unfrozenTransforms
 
 def layers(nodes, _):
     layers = []
+    nodeNames = _getNodeNames(nodes)
     for node in nodes:
-        nodeName = _getNodeName(node)
+        nodeName = nodeNames[node]
         layer = cmds.listConnections(nodeName, type="displayLayer")
         if layer:
             layers.append(node)
     return "nodes", layers
 
-def shaders(transformNodes, _):
+def shaders(transformNodes, SLMesh):
     shaders = []
+    shadingGroups = _shadingGroups(SLMesh)
     for node in transformNodes:
-        nodeName = _getNodeName(node)
-        shape = cmds.listRelatives(nodeName, shapes=True, fullPath=True)
-        if cmds.nodeType(shape) == 'mesh' and shape:
-            shadingGrps = cmds.listConnections(shape, type='shadingEngine')
-            if shadingGrps[0] != 'initialShadingGroup':
-                shaders.append(node)
+        if node in shadingGroups and shadingGroups[node] != 'initialShadingGroup':
+            shaders.append(node)
     return "nodes", shaders
 
 def history(nodes, _):
     history = []
-    for node in nodes:
-        nodeName = _getNodeName(node)
-        shape = cmds.listRelatives(nodeName, shapes=True, fullPath=True)
-        if shape and cmds.nodeType(shape[0]) == 'mesh':
-            historySize = len(cmds.listHistory(shape))
-            if historySize > 1:
-                history.append(node)
+    shapes = {node: shape for node, shape in _getShapes(nodes).items() if shape}
+    # Resolve every shape type with a single ls instead of one nodeType per node
+    meshShapes = _meshShapes(shapes)
+    selection = om.MSelectionList()
+    meshNodes = []
+    for node, shape in shapes.items():
+        if shape[0] not in meshShapes:
+            continue
+        # The deformed shape isn't always the first one, an unconnected
+        # intermediate shape such as *Orig can come before it
+        for meshShape in shape:
+            if meshShape in meshShapes:
+                selection.add(meshShape)
+                meshNodes.append(node)
+    # Construction history feeds the mesh through inMesh, so a connected
+    # inMesh plug answers the check without walking the whole history
+    for index, node in enumerate(meshNodes):
+        inMesh = om.MFnDependencyNode(selection.getDependNode(index)).findPlug('inMesh', False)
+        if inMesh.isDestination and (not history or history[-1] != node):
+            history.append(node)
     return "nodes", history
 
 def uncenteredPivots(nodes, _):
     uncenteredPivots = []
+    nodeNames = _getNodeNames(nodes)
     for node in nodes:
-        nodeName = _getNodeName(node)
+        nodeName = nodeNames[node]
         if cmds.xform(nodeName, q=1, ws=1, rp=1) != [0, 0, 0]:
             uncenteredPivots.append(node)
     return "nodes", uncenteredPivots
@@ -350,23 +858,44 @@ def uncenteredPivots(nodes, _):
 
 def emptyGroups(nodes, _):
     emptyGroups = []
+    longNames = _getLongNames(nodes)
+    # A node has descendants exactly when it has a child, so one children
+    # query over every node replaces a listRelatives call per node
+    names = [name for name in longNames.values() if name]
+    parents = set()
+    if names:
+        for child in cmds.listRelatives(names, children=True, fullPath=True) or []:
+            parents.add(child.rpartition('|')[0])
+    # An instanced node can be listed under another of its paths, so those
+    # are queried one at a time by UUID
+    instanced = _instancedNodes(longNames)
     for node in nodes:
-        nodeName = _getNodeName(node)
-        if not cmds.listRelatives(nodeName, ad=True):
+        if not longNames[node]:
+            continue
+        if node in instanced:
+            if not cmds.listRelatives(node, children=True):
+                emptyGroups.append(node)
+        elif longNames[node] not in parents:
             emptyGroups.append(node)
     return "nodes", emptyGroups
 
 def parentGeometry(transformNodes, _):
     parentGeometry = []
+    longNames = _getLongNames(transformNodes)
+    parentPaths = {name.rpartition('|')[0] for name in longNames.values() if name}
+    parentPaths.discard('')
+    # List the mesh children of every parent path with one query, the child
+    # paths start with the parent path they were listed under, so instanced
+    # parents are matched on the path the node was resolved to
+    meshParents = set()
+    if parentPaths:
+        for child in cmds.listRelatives(list(parentPaths), children=True, type='mesh',
+                                        fullPath=True) or []:
+            meshParents.add(child.rpartition('|')[0])
     for node in transformNodes:
-        nodeName = _getNodeName(node)
-        parents = cmds.listRelatives(nodeName, p=True, fullPath=True)
-        if parents:
-            for parent in parents:
-                children = cmds.listRelatives(parent, fullPath=True)
-                for child in children:
-                    if cmds.nodeType(child) == 'mesh':
-                        parentGeometry.append(node)
+        longName = longNames[node]
+        if longName and longName.rpartition('|')[0] in meshParents:
+            parentGeometry.append(node)
     return "nodes", parentGeometry
 
 
@@ -384,6 +913,9 @@ def flippedNormals(_, SLMesh):
         4. If dot product of normal and this vector is negative,
            the normal points inward (flipped)
 
+        With NumPy, face centers are averaged from the vertex positions and
+        face normals summed from the triangle normals of all faces at once.
+
     Note:
         All calculations are performed in object space to ensure correct
         results regardless of the mesh's transform (translation, rotation,
@@ -413,19 +945,24 @@ def flippedNormals(_, SLMesh):
         intentionally inward-facing or errors.
     """
     flippedNormals = defaultdict(list)
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        dagPath = selIt.getDagPath()
-        mesh = om.MFnMesh(dagPath)
-        fn = om.MFnDependencyNode(dagPath.node())
-        uuid = fn.uuid().asString()
-
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
         # Get mesh bounding box center as reference point
         boundingBox = mesh.boundingBox
         meshCenter = boundingBox.center
 
+        if np is not None:
+            points = _pointsArray(mesh)
+            faceNormals = _faceNormals(mesh)
+            counts, vertices, following = _faceVertices(mesh)
+            cornerFaceIds = np.repeat(np.arange(mesh.numPolygons), counts)
+            faceCenters = _sumPerFace(
+                cornerFaceIds, points[vertices], mesh.numPolygons) / counts[:, None]
+            toFace = faceCenters - (meshCenter.x, meshCenter.y, meshCenter.z)
+            _addFlagged(flippedNormals, uuid, np.einsum('ij,ij->i', faceNormals, toFace) < 0)
+            continue
+
         faceIt = om.MItMeshPolygon(dagPath)
-        while not faceIt.isDone():
+        for index in range(mesh.numPolygons):
             # Get face center and normal in OBJECT space (matches bounding box space)
             faceCenter = faceIt.center(om.MSpace.kObject)
             faceNormal = faceIt.getNormal(om.MSpace.kObject)
@@ -443,10 +980,9 @@ def flippedNormals(_, SLMesh):
                          faceNormal.z * toFace.z)
 
             if dotProduct < 0:
-                flippedNormals[uuid].append(faceIt.index())
+                flippedNormals[uuid].append(index)
 
             faceIt.next()
-        selIt.next()
     return "polygon", flippedNormals
 
 
@@ -466,6 +1002,9 @@ def overlappingVertices(_, SLMesh):
         3. For each vertex, check nearby vertices within tolerance
         4. Report vertices that share positions with other vertices
 
+    With NumPy the grid lookup and distance test run over the whole point
+    array at once (see _overlappingPoints), otherwise in a Python loop.
+
     Args:
         _: Unused parameter (node list, maintained for API consistency)
         SLMesh: MSelectionList containing mesh shapes to check
@@ -491,19 +1030,21 @@ def overlappingVertices(_, SLMesh):
     overlapping = defaultdict(list)
     tolerance = 0.0001  # Position tolerance for overlap detection
 
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        dagPath = selIt.getDagPath()
-        mesh = om.MFnMesh(dagPath)
-        fn = om.MFnDependencyNode(dagPath.node())
-        uuid = fn.uuid().asString()
+    if np is not None:
+        contexts = _meshContexts(SLMesh)
+        pointArrays = [_pointsArray(mesh, om.MSpace.kWorld) for dagPath, uuid, mesh in contexts]
+        masks = _mapArrays(partial(_overlappingPoints, tolerance=tolerance), pointArrays)
+        for (dagPath, uuid, mesh), mask in zip(contexts, masks):
+            _addFlagged(overlapping, uuid, mask)
+        return "vertex", overlapping
+
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
 
         # Get all vertex positions in world space
         points = mesh.getPoints(om.MSpace.kWorld)
         numVerts = len(points)
 
         if numVerts == 0:
-            selIt.next()
             continue
 
         # Build spatial hash for efficient lookup
@@ -554,7 +1095,6 @@ def overlappingVertices(_, SLMesh):
                                         overlapping[uuid].append(j)
                                         markedVerts.add(j)
 
-        selIt.next()
     return "vertex", overlapping
 
 
@@ -601,21 +1141,13 @@ def polyCountLimit(nodes, SLMesh):
     """
     overLimit = []
 
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        dagPath = selIt.getDagPath()
-        mesh = om.MFnMesh(dagPath)
-        fn = om.MFnDependencyNode(dagPath.node())
-        uuid = fn.uuid().asString()
-
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
         # Get polygon count
         polyCount = mesh.numPolygons
 
         if polyCount > POLY_COUNT_LIMIT:
             overLimit.append(uuid)
 
-        selIt.next()
-
     return "nodes", overLimit
 
 
@@ -632,8 +1164,9 @@ def missingTextures(nodes, _):
 
     Algorithm:
         1. Find all 'file' texture nodes in the scene
-        2. For each file node, get the 'fileTextureName' attribute
-        3. Check if the file exists on disk using os.path.exists
+        2. For each file node, read the 'fileTextureName' plug
+        3. List each texture folder once with os.scandir and look the
+           file name up in it
         4. Flag nodes where the file path is set but file doesn't exist
 
     Args:
@@ -657,32 +1190,50 @@ def missingTextures(nodes, _):
         - Forgetting to include textures when submitting assignments
         This check helps catch these issues before submission.
     """
-    import os
-
     missingFiles = []
 
     # Get all file texture nodes in the scene
     fileNodes = cmds.ls(type='file') or []
-
+    selection = om.MSelectionList()
     for fileNode in fileNodes:
-        # Get the file path from the texture node
-        texturePath = cmds.getAttr(fileNode + '.fileTextureName')
+        selection.add(fileNode)
+
+    # Group the texture paths by directory so each folder is listed once
+    # instead of calling stat() on every file, textures usually share a few
+    # asset folders and those may sit on a network share
+    byDirectory = defaultdict(list)
+    for index in range(selection.length()):
+        # Read the file path and UUID from the node itself instead of a
+        # getAttr and an ls call per node
+        fileNode = om.MFnDependencyNode(selection.getDependNode(index))
+        texturePath = fileNode.findPlug('fileTextureName', False).asString()
 
         # Skip if no path is set (empty string)
         if not texturePath:
             continue
+        uuid = fileNode.uuid().asString()
+        directory, fileName = os.path.split(texturePath)
+        byDirectory[directory or os.curdir].append((uuid, texturePath, fileName))
 
-        # Check if the file exists
-        if not os.path.exists(texturePath):
-            # Get UUID for the file node
-            uuid = cmds.ls(fileNode, uuid=True)
-            if uuid:
-                missingFiles.append(uuid[0])
+    for directory, textures in byDirectory.items():
+        try:
+            with os.scandir(directory) as entries:
+                present = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            # Unreadable or missing folder, fall back to checking each file
+            present = None
+        for uuid, texturePath, fileName in textures:
+            if present is None or not fileName:
+                exists = os.path.exists(texturePath)
+            else:
+                exists = os.path.normcase(fileName) in present
+            if not exists:
+                missingFiles.append(uuid)
 
     return "nodes", missingFiles
 
 
-def defaultMaterials(transformNodes, _):
+def defaultMaterials(transformNodes, SLMesh):
     """Detect meshes still using the default lambert1 material.
 
     This check identifies meshes that are assigned to the initialShadingGroup
@@ -693,13 +1244,13 @@ def defaultMaterials(transformNodes, _):
     - Professional standards were not met
 
     Algorithm:
-        1. For each transform node, get its shape(s)
-        2. Query shading engine connections
-        3. Flag meshes connected to 'initialShadingGroup'
+        1. For each mesh, query its connected shaders with
+           MFnMesh.getConnectedShaders
+        2. Flag meshes whose first shading group is 'initialShadingGroup'
 
     Args:
         transformNodes: List of transform node UUIDs to check
-        _: MSelectionList (not used for this check)
+        SLMesh: MSelectionList containing the meshes of transformNodes
 
     Returns:
         tuple: ("nodes", list) where list contains UUIDs of transforms
@@ -717,19 +1268,12 @@ def defaultMaterials(transformNodes, _):
         forgotten during the texturing phase.
     """
     defaultMats = []
+    shadingGroups = _shadingGroups(SLMesh)
 
     for node in transformNodes:
-        nodeName = _getNodeName(node)
-        shape = cmds.listRelatives(nodeName, shapes=True, fullPath=True)
-
-        if shape and cmds.nodeType(shape[0]) == 'mesh':
-            # Get shading engines connected to this shape
-            shadingGrps = cmds.listConnections(shape, type='shadingEngine')
-
-            if shadingGrps:
-                # Check if using initialShadingGroup (lambert1)
-                if shadingGrps[0] == 'initialShadingGroup':
-                    defaultMats.append(node)
+        # Check if using initialShadingGroup (lambert1)
+        if shadingGroups.get(node) == 'initialShadingGroup':
+            defaultMats.append(node)
 
     return "nodes", defaultMats
 
@@ -850,59 +1394,65 @@ def uvDistortion(_, SLMesh):
         3D models. Stretched textures immediately signal poor craftsmanship
         to evaluators and are a common point deduction in assignments.
     """
-    import math
-
     distortedFaces = defaultdict(list)
+    uvAreas = _uvAreas(SLMesh) if np is not None else None
 
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        dagPath = selIt.getDagPath()
-        mesh = om.MFnMesh(dagPath)
-        fn = om.MFnDependencyNode(dagPath.node())
-        uuid = fn.uuid().asString()
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        if mesh.numUVs() == 0:
+            continue
+        if np is not None:
+            area3D, uvArea, hasUVs = uvAreas[uuid]
+            valid = hasUVs & (area3D > 0.0001) & (uvArea > 0.0000001)
+            if not valid.any():
+                continue
+            ratios = np.divide(uvArea, area3D, out=np.zeros_like(uvArea), where=valid)
+            # Select the middle value without sorting every face
+            middle = np.count_nonzero(valid) // 2
+            medianRatio = np.partition(ratios[valid], middle)[middle]
+            if medianRatio < 0.0000001:
+                continue
+            normalizedRatios = ratios / medianRatio
+            _addFlagged(distortedFaces, uuid, valid & (
+                (normalizedRatios < UV_DISTORTION_THRESHOLD) |
+                (normalizedRatios > UV_DISTORTION_THRESHOLD_MAX)))
+            continue
 
         # First pass: calculate average ratio for normalization
         ratios = []
         faceIt = om.MItMeshPolygon(dagPath)
-        while not faceIt.isDone():
+        for index in range(mesh.numPolygons):
             if faceIt.hasUVs():
                 # Get 3D area
                 area3D = faceIt.getArea()
 
-                # Get UV area - need to calculate from UV coordinates
-                try:
-                    uvs = faceIt.getUVs()
-                    uvArea = _calculateUVPolygonArea(uvs[0], uvs[1])
+                # Get UV area - need to calculate from UV coordinates,
+                # hasUVs() already guarantees getUVs() succeeds
+                uvs = faceIt.getUVs()
+                uvArea = _calculateUVPolygonArea(uvs[0], uvs[1])
 
-                    if area3D > 0.0001 and uvArea > 0.0000001:
-                        ratio = uvArea / area3D
-                        ratios.append((faceIt.index(), ratio, area3D, uvArea))
-                except:
-                    pass  # Skip faces with UV errors
+                if area3D > 0.0001 and uvArea > 0.0000001:
+                    ratio = uvArea / area3D
+                    ratios.append((index, ratio))
 
             faceIt.next()
 
         # Calculate median ratio for normalization
         if not ratios:
-            selIt.next()
             continue
 
         sortedRatios = sorted([r[1] for r in ratios])
         medianRatio = sortedRatios[len(sortedRatios) // 2]
 
         if medianRatio < 0.0000001:
-            selIt.next()
             continue
 
         # Second pass: flag faces that deviate significantly from median
-        for faceIdx, ratio, area3D, uvArea in ratios:
+        for faceIdx, ratio in ratios:
             normalizedRatio = ratio / medianRatio
 
             if normalizedRatio < UV_DISTORTION_THRESHOLD or normalizedRatio > UV_DISTORTION_THRESHOLD_MAX:
                 distortedFaces[uuid].append(faceIdx)
 
-        selIt.next()
-
     return "polygon", distortedFaces
 
 
@@ -916,15 +1466,17 @@ def _calculateUVPolygonArea(uCoords, vCoords):
     Returns:
         float: Area of the polygon in UV space
     """
-    n = len(uCoords)
-    if n < 3:
+    if len(uCoords) < 3:
         return 0.0
+    if len(uCoords) == 3:
+        # Triangles need no loop, half the cross product of two sides
+        return abs((uCoords[1] - uCoords[0]) * (vCoords[2] - vCoords[0]) -
+                   (uCoords[2] - uCoords[0]) * (vCoords[1] - vCoords[0])) / 2.0
 
-    area = 0.0
-    for i in range(n):
-        j = (i + 1) % n
-        area += uCoords[i] * vCoords[j]
-        area -= uCoords[j] * vCoords[i]
+    # Pair every corner with the next one, wrapping the last back to the first
+    u = list(uCoords)
+    v = list(vCoords)
+    area = sum(u0 * v1 - u1 * v0 for u0, v0, u1, v1 in zip(u, v, u[1:] + u[:1], v[1:] + v[:1]))
 
     return abs(area) / 2.0
 
@@ -987,46 +1539,55 @@ def texelDensity(_, SLMesh):
         that proper UV planning was not done. This is frequently checked
         in portfolio reviews and assignment grading.
     """
-    import math
-
     densityErrors = defaultdict(list)
+    uvAreas = _uvAreas(SLMesh) if np is not None else None
 
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        dagPath = selIt.getDagPath()
-        mesh = om.MFnMesh(dagPath)
-        fn = om.MFnDependencyNode(dagPath.node())
-        uuid = fn.uuid().asString()
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        if mesh.numUVs() == 0:
+            continue
+        if np is not None:
+            area3D, uvArea, hasUVs = uvAreas[uuid]
+            pixelArea = uvArea * (TEXEL_DENSITY_TEXTURE_SIZE ** 2)
+            valid = hasUVs & (area3D > 0.0001) & (pixelArea > 0)
+            if np.count_nonzero(valid) < 2:
+                continue
+            densities = np.divide(pixelArea, area3D, out=np.zeros_like(pixelArea), where=valid)
+            # Select the middle value without sorting every face
+            middle = np.count_nonzero(valid) // 2
+            medianDensity = np.partition(densities[valid], middle)[middle]
+            if medianDensity < 0.0001:
+                continue
+            ratios = densities / medianDensity
+            _addFlagged(densityErrors, uuid, valid & (
+                (ratios < TEXEL_DENSITY_THRESHOLD) |
+                (ratios > TEXEL_DENSITY_THRESHOLD_MAX)))
+            continue
 
         # Calculate texel density for each face
         densities = []
         faceIt = om.MItMeshPolygon(dagPath)
-        while not faceIt.isDone():
+        for index in range(mesh.numPolygons):
             if faceIt.hasUVs():
                 # Get 3D area
                 area3D = faceIt.getArea()
 
-                # Get UV area
-                try:
-                    uvs = faceIt.getUVs()
-                    uvArea = _calculateUVPolygonArea(uvs[0], uvs[1])
+                # Get UV area, hasUVs() already guarantees getUVs() succeeds
+                uvs = faceIt.getUVs()
+                uvArea = _calculateUVPolygonArea(uvs[0], uvs[1])
 
-                    # Convert UV area to pixel area (UV 0-1 space to texture pixels)
-                    pixelArea = uvArea * (TEXEL_DENSITY_TEXTURE_SIZE ** 2)
+                # Convert UV area to pixel area (UV 0-1 space to texture pixels)
+                pixelArea = uvArea * (TEXEL_DENSITY_TEXTURE_SIZE ** 2)
 
-                    # Calculate texel density (pixels per world unit squared)
-                    if area3D > 0.0001:
-                        texelDensityValue = pixelArea / area3D
-                        if texelDensityValue > 0:
-                            densities.append((faceIt.index(), texelDensityValue))
-                except:
-                    pass  # Skip faces with UV errors
+                # Calculate texel density (pixels per world unit squared)
+                if area3D > 0.0001:
+                    texelDensityValue = pixelArea / area3D
+                    if texelDensityValue > 0:
+                        densities.append((index, texelDensityValue))
 
             faceIt.next()
 
         # Need enough samples to calculate meaningful median
         if len(densities) < 2:
-            selIt.next()
             continue
 
         # Calculate median texel density for this mesh
@@ -1034,7 +1595,6 @@ def texelDensity(_, SLMesh):
         medianDensity = sortedDensities[len(sortedDensities) // 2]
 
         if medianDensity < 0.0001:
-            selIt.next()
             continue
 
         # Flag faces that deviate significantly from median
@@ -1044,8 +1604,6 @@ def texelDensity(_, SLMesh):
             if ratio < TEXEL_DENSITY_THRESHOLD or ratio > TEXEL_DENSITY_THRESHOLD_MAX:
                 densityErrors[uuid].append(faceIdx)
 
-        selIt.next()
-
     return "polygon", densityErrors
 
 
@@ -1077,7 +1635,7 @@ def textureResolution(_, __):
     Algorithm:
         1. Find all 'file' texture nodes in the scene
         2. For each file node, get the texture file path
-        3. Query the image dimensions using Maya's getAttr on outSize
+        3. Read the image dimensions from the outSize plugs
         4. Check if both width and height are powers of 2
         5. Flag nodes where either dimension is not a power of 2
 
@@ -1103,16 +1661,18 @@ def textureResolution(_, __):
         common mistake that results in wasted memory and compatibility
         issues when exporting to game engines.
     """
-    import os
-
     nonPowerOfTwoNodes = []
 
     # Get all file texture nodes in the scene
     fileNodes = cmds.ls(type='file') or []
-
+    selection = om.MSelectionList()
     for fileNode in fileNodes:
-        # Get the file path from the texture node
-        texturePath = cmds.getAttr(fileNode + '.fileTextureName')
+        selection.add(fileNode)
+
+    for index in range(selection.length()):
+        # Read the plugs of the node directly instead of a getAttr per value
+        fileNode = om.MFnDependencyNode(selection.getDependNode(index))
+        texturePath = fileNode.findPlug('fileTextureName', False).asString()
 
         # Skip if no path is set
         if not texturePath:
@@ -1125,8 +1685,8 @@ def textureResolution(_, __):
         try:
             # Get the output size of the texture (width, height)
             # This queries the actual loaded image dimensions
-            outSizeX = cmds.getAttr(fileNode + '.outSizeX')
-            outSizeY = cmds.getAttr(fileNode + '.outSizeY')
+            outSizeX = fileNode.findPlug('outSizeX', False).asFloat()
+            outSizeY = fileNode.findPlug('outSizeY', False).asFloat()
 
             # Check if both dimensions are powers of 2
             if outSizeX and outSizeY:
@@ -1134,10 +1694,7 @@ def textureResolution(_, __):
                 height = int(outSizeY)
 
                 if not _isPowerOfTwo(width) or not _isPowerOfTwo(height):
-                    # Get UUID for the file node
-                    uuid = cmds.ls(fileNode, uuid=True)
-                    if uuid:
-                        nonPowerOfTwoNodes.append(uuid[0])
+                    nonPowerOfTwoNodes.append(fileNode.uuid().asString())
         except Exception:
             # Skip nodes that fail to query (corrupted, missing, etc.)
             pass
@@ -1192,50 +1749,71 @@ def unusedNodes(_, __):
         student submissions.
     """
     unusedNodesList = []
+    unusedNames = []
 
-    # Get all shading engines in the scene
-    shadingEngines = cmds.ls(type='shadingEngine') or []
-
-    for shadingEngine in shadingEngines:
-        # Skip default shading groups
-        if shadingEngine in DEFAULT_SHADING_GROUPS:
-            continue
+    # Get all shading engines in the scene, skipping default shading groups
+    shadingEngines = [shadingEngine for shadingEngine in cmds.ls(type='shadingEngine') or []
+                      if shadingEngine not in DEFAULT_SHADING_GROUPS]
 
-        # Check if this shading engine has any geometry assigned
-        # The 'dagSetMembers' attribute lists connected geometry
+    # Check which shading engines have any geometry assigned
+    # The 'dagSetMembers' and 'dnSetMembers' attributes hold the set members,
+    # so one connection query over all of them replaces a sets call per engine
+    if shadingEngines:
         try:
-            members = cmds.sets(shadingEngine, query=True) or []
-            if len(members) == 0:
-                # No geometry assigned - this is unused
-                uuid = cmds.ls(shadingEngine, uuid=True)
-                if uuid:
-                    unusedNodesList.append(uuid[0])
+            memberPlugs = [shadingEngine + attribute for shadingEngine in shadingEngines
+                           for attribute in ('.dagSetMembers', '.dnSetMembers')]
+            pairs = cmds.listConnections(memberPlugs, source=True, destination=False,
+                                         connections=True) or []
+            assigned = {plug.partition('.')[0] for plug in pairs[::2]}
+            # No geometry assigned - this is unused
+            unusedNames.extend(shadingEngine for shadingEngine in shadingEngines
+                               if shadingEngine not in assigned)
         except Exception:
-            pass  # Skip problematic shading engines
+            # Query the shading engines one at a time so only the problematic
+            # ones are skipped
+            for shadingEngine in shadingEngines:
+                try:
+                    if not cmds.sets(shadingEngine, query=True):
+                        unusedNames.append(shadingEngine)
+                except Exception:
+                    pass  # Skip problematic shading engines
 
     # Also check for orphaned materials (materials not connected to any shading engine)
     # This catches materials that were disconnected but not deleted
     materialTypes = ['lambert', 'blinn', 'phong', 'phongE', 'standardSurface',
                      'aiStandardSurface', 'surfaceShader', 'useBackground']
 
+    # ls also returns derived types (blinn and phong are lambert subtypes),
+    # so keep each material once
+    materials = {}
     for matType in materialTypes:
-        materials = cmds.ls(type=matType) or []
-        for material in materials:
+        for material in cmds.ls(type=matType) or []:
             # Skip default materials
-            if material in DEFAULT_MATERIALS:
-                continue
+            if material not in DEFAULT_MATERIALS:
+                materials[material] = None
 
-            # Check if material is connected to any shading engine
-            try:
-                connections = cmds.listConnections(material + '.outColor',
-                                                    type='shadingEngine') or []
-                if len(connections) == 0:
-                    # Material not connected to any shading engine
-                    uuid = cmds.ls(material, uuid=True)
-                    if uuid:
-                        unusedNodesList.append(uuid[0])
-            except Exception:
-                pass  # Skip problematic materials
+    # Check which materials are connected to any shading engine, the query
+    # returns each material plug paired with a connected shading engine
+    if materials:
+        try:
+            pairs = cmds.listConnections([material + '.outColor' for material in materials],
+                                         type='shadingEngine', connections=True) or []
+            connected = {plug.partition('.')[0] for plug in pairs[::2]}
+            # Material not connected to any shading engine
+            unusedNames.extend(material for material in materials if material not in connected)
+        except Exception:
+            # Query the materials one at a time so only the problematic ones
+            # are skipped
+            for material in materials:
+                try:
+                    if not cmds.listConnections(material + '.outColor', type='shadingEngine'):
+                        unusedNames.append(material)
+                except Exception:
+                    pass  # Skip problematic materials
+
+    # Get the UUIDs of all unused nodes with a single ls call
+    if unusedNames:
+        unusedNodesList.extend(cmds.ls(unusedNames, uuid=True) or [])
 
     return "nodes", unusedNodesList
 
@@ -1280,30 +1858,38 @@ def hiddenObjects(transformNodes, _):
     """
     hiddenNodes = []
 
-    for node in transformNodes:
-        nodeName = _getNodeName(node)
-
-        # Check if this transform has a mesh shape child
-        shapes = cmds.listRelatives(nodeName, shapes=True, fullPath=True) or []
-        hasMesh = any(cmds.nodeType(s) == 'mesh' for s in shapes)
+    longNames = _getLongNames(transformNodes)
+    shapesByNode = _getShapes(transformNodes)
+    # Resolve every shape type at once instead of one nodeType per shape
+    meshShapes = _meshShapes(shapesByNode)
 
-        if not hasMesh:
-            continue  # Skip non-mesh transforms (cameras, lights, etc.)
+    # Resolve the mesh transforms into one selection list so their plugs can
+    # be read directly instead of a getAttr and listConnections per node
+    selection = om.MSelectionList()
+    meshNodes = []
+    for node in transformNodes:
+        # Skip non-mesh transforms (cameras, lights, etc.)
+        if longNames[node] and any(shape in meshShapes for shape in shapesByNode[node]):
+            selection.add(longNames[node])
+            meshNodes.append(node)
 
+    for index, node in enumerate(meshNodes):
         try:
+            transform = om.MFnDependencyNode(selection.getDependNode(index))
+
             # Check direct visibility attribute
-            visibility = cmds.getAttr(nodeName + '.visibility')
-            if not visibility:
+            if not transform.findPlug('visibility', False).asBool():
                 hiddenNodes.append(node)
                 continue
 
             # Check if object is in a hidden display layer
-            drawOverride = cmds.listConnections(nodeName + '.drawOverride',
-                                                 type='displayLayer') or []
-            for layer in drawOverride:
-                if layer != 'defaultLayer':  # Ignore default layer
-                    layerVisible = cmds.getAttr(layer + '.visibility')
-                    if not layerVisible:
+            drawOverride = transform.findPlug('drawOverride', False)
+            for source in drawOverride.connectedTo(True, False):
+                if not source.node().hasFn(om.MFn.kDisplayLayer):
+                    continue
+                layer = om.MFnDependencyNode(source.node())
+                if layer.name() != 'defaultLayer':  # Ignore default layer
+                    if not layer.findPlug('visibility', False).asBool():
                         hiddenNodes.append(node)
                         break
 
@@ -1381,13 +1967,29 @@ def namingConvention(transformNodes, _):
     """
     invalidNodes = []
 
+    longNames = _getLongNames(transformNodes)
+    shapesByNode = _getShapes(transformNodes)
+    # Resolve the types of every transform and first shape, and the children
+    # of the transforms without shapes, with one query each
+    nodeTypes = _nodeTypes([name for name in longNames.values() if name] +
+                           [shapes[0] for shapes in shapesByNode.values() if shapes])
+    groups = [longNames[node] for node in transformNodes
+              if longNames[node] and not shapesByNode[node]]
+    parents = set()
+    if groups:
+        for child in cmds.listRelatives(groups, children=True, fullPath=True) or []:
+            parents.add(child.rpartition('|')[0])
+    # startswith() tests a tuple of prefixes in one call, build them per run
+    # so edits to NAMING_CONVENTION_PATTERNS still apply
+    prefixes = {objectType: tuple(patterns)
+                for objectType, patterns in NAMING_CONVENTION_PATTERNS.items()}
     for node in transformNodes:
-        nodeName = _getNodeName(node)
-        if not nodeName:
+        longName = longNames[node]
+        if not longName:
             continue
 
         # Get the short name (without the DAG path)
-        shortName = nodeName.rsplit('|', 1)[-1]
+        shortName = longName.rpartition('|')[2]
 
         # Remove any trailing numbers for base name check
         baseName = shortName.rstrip('0123456789')
@@ -1398,12 +2000,12 @@ def namingConvention(transformNodes, _):
             continue
 
         # Check 2: Determine object type and verify prefix
-        shapes = cmds.listRelatives(nodeName, shapes=True, fullPath=True) or []
+        shapes = shapesByNode[node]
 
         objectType = None
         if shapes:
             # Has shapes - check what type
-            shapeType = cmds.nodeType(shapes[0])
+            shapeType = nodeTypes.get(shapes[0])
             if shapeType == 'mesh':
                 objectType = 'mesh'
             elif shapeType in ('nurbsCurve', 'bezierCurve'):
@@ -1419,13 +2021,12 @@ def namingConvention(transformNodes, _):
                 objectType = 'joint'
         else:
             # No shapes - it's a group (empty transform)
-            children = cmds.listRelatives(nodeName, children=True) or []
-            if children:
+            if longNames[node] in parents:
                 objectType = 'group'
             # Empty groups without children are handled elsewhere
 
         # Check if the node is a joint (joints are transforms, not shapes)
-        if cmds.nodeType(nodeName) == 'joint':
+        if nodeTypes.get(longNames[node]) == 'joint':
             objectType = 'joint'
 
         # Skip objects without a defined type (empty groups, unknown types)
@@ -1433,10 +2034,7 @@ def namingConvention(transformNodes, _):
             continue
 
         # Check if name has valid prefix for its type
-        validPrefixes = NAMING_CONVENTION_PATTERNS.get(objectType, [])
-        hasValidPrefix = any(shortName.startswith(prefix) for prefix in validPrefixes)
-
-        if not hasValidPrefix:
+        if not shortName.startswith(prefixes.get(objectType, ())):
             invalidNodes.append(node)
 
     return "nodes", invalidNodes
@@ -1491,18 +2089,11 @@ def hierarchyDepth(transformNodes, _):
     """
     tooDeepNodes = []
 
+    # Full DAG paths of all nodes, resolved with a single cmds.ls call
+    longNames = _getLongNames(transformNodes)
     for node in transformNodes:
-        nodeName = _getNodeName(node)
-        if not nodeName:
-            continue
-
-        # Get the full DAG path
-        try:
-            fullPath = cmds.ls(nodeName, long=True)
-            if not fullPath:
-                continue
-            fullPath = fullPath[0]
-        except Exception:
+        fullPath = longNames[node]
+        if not fullPath:
             continue
 
         # Count depth by counting '|' separators
@@ -1535,6 +2126,10 @@ def concaveFaces(_, SLMesh):
         3. Flag faces that return False (non-convex)
         4. Triangles are always convex, so they pass automatically
 
+        With NumPy, every corner of every face is tested at once instead:
+        a face is concave when the cross product of the edges into and out
+        of a corner points against the face normal.
+
     Args:
         _: List of node UUIDs (not used for this check)
         SLMesh: MSelectionList containing mesh shapes to check
@@ -1557,21 +2152,29 @@ def concaveFaces(_, SLMesh):
     """
     concave = defaultdict(list)
 
-    selIt = om.MItSelectionList(SLMesh)
-    while not selIt.isDone():
-        faceIt = om.MItMeshPolygon(selIt.getDagPath())
-        fn = om.MFnDependencyNode(selIt.getDagPath().node())
-        uuid = fn.uuid().asString()
-
-        while not faceIt.isDone():
-            # Triangles are always convex, skip them for efficiency
-            if faceIt.polygonVertexCount() > 3:
-                # isConvex() returns True for convex faces
-                if not faceIt.isConvex():
-                    concave[uuid].append(faceIt.index())
-            faceIt.next()
-
-        selIt.next()
+    if np is not None:
+        # All triangle meshes can't have concave faces, skip their arrays
+        contexts = [context for context in _meshContexts(SLMesh)
+                    if (_faceVertices(context.mesh)[0] > 3).any()]
+        masks = _mapArrays(_concavePolygons, [
+            _faceVertices(mesh) + (_pointsArray(mesh), _faceNormals(mesh))
+            for dagPath, uuid, mesh in contexts])
+        for (dagPath, uuid, mesh), mask in zip(contexts, masks):
+            _addFlagged(concave, uuid, mask)
+        return "polygon", concave
+
+    for dagPath, uuid, mesh in _meshContexts(SLMesh):
+        # Triangles are always convex, so read the face sizes in one call and
+        # only visit the larger faces, an all triangle mesh needs no iterator
+        polygons = [index for index, count in enumerate(mesh.getVertices()[0]) if count > 3]
+        if not polygons:
+            continue
+        faceIt = om.MItMeshPolygon(dagPath)
+        for index in polygons:
+            faceIt.setIndex(index)
+            # isConvex() returns True for convex faces
+            if not faceIt.isConvex():
+                concave[uuid].append(index)
 
     return "polygon", concave
 
@@ -1591,7 +2194,7 @@ def intermediateObjects(transformNodes, _):
 
     Algorithm:
         1. For each transform node, get its shape children
-        2. Check if any shape has the 'intermediateObject' attribute set to True
+        2. Check if any shape is among the scene's intermediate objects
         3. Flag transforms that have intermediate shape nodes
         4. Skip checking the intermediate shapes themselves
 
@@ -1617,24 +2220,13 @@ def intermediateObjects(transformNodes, _):
     """
     nodesWithIntermediates = []
 
+    shapesByNode = _getShapes(transformNodes)
+    # List every intermediate shape in the scene with a single ls instead of
+    # querying the intermediateObject attribute of each shape
+    intermediates = set(cmds.ls(intermediateObjects=True, long=True) or [])
     for node in transformNodes:
-        nodeName = _getNodeName(node)
-        if not nodeName:
-            continue
-
-        try:
-            # Get all shape children of this transform
-            shapes = cmds.listRelatives(nodeName, shapes=True, fullPath=True) or []
-
-            for shape in shapes:
-                # Check if this shape is marked as intermediate
-                if cmds.attributeQuery('intermediateObject', node=shape, exists=True):
-                    isIntermediate = cmds.getAttr(shape + '.intermediateObject')
-                    if isIntermediate:
-                        nodesWithIntermediates.append(node)
-                        break  # Only need to flag once per transform
-
-        except Exception:
-            pass  # Skip nodes that fail to query
+        # Only need to flag once per transform
+        if any(shape in intermediates for shape in shapesByNode[node]):
+            nodesWithIntermediates.append(node)
 
     return "nodes", nodesWithIntermediates